@@ -5,23 +5,41 @@ KST 시간 기준으로 설정된 시간에 서보모터를 동작시켜 먹이
 모든 이벤트를 원격 서버로 전송
 """
 
-import RPi.GPIO as GPIO
-import schedule
+import pigpio
 import time
 import json
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import signal
-import sys
+import os
+import select
+import ctypes
+import atexit
+import struct
+import gzip
+import heapq
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from servo import (
+    ContinuousServo, PositionalServo,
+    DEFAULT_STOP_DUTY, DEFAULT_CW_DUTY, DEFAULT_CCW_DUTY, DEFAULT_ROTATION_TIME,
+    DEFAULT_MIN_DUTY, DEFAULT_MAX_DUTY, DEFAULT_OPEN_ANGLE, DEFAULT_CLOSE_ANGLE,
+    DEFAULT_MOVE_TIME
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# 서보모터 기본 설정 (연속 회전 서보)
-SERVO_PIN = 12
-DEFAULT_STOP_DUTY = 7.5      # 정지
-DEFAULT_CW_DUTY = 9.75       # 시계방향 (열기) - 절반 속도
-DEFAULT_CCW_DUTY = 5.25      # 반시계방향 (닫기) - 절반 속도
-DEFAULT_ROTATION_TIME = 10   # 10바퀴 회전에 필요한 시간 (초)
+# 서보 종류 기본값 ('continuous': 연속 회전, 'positional': 각도 제어)
+DEFAULT_SERVO_TYPE = "continuous"
 
 # 한국 시간대 설정
 KST = timezone(timedelta(hours=9))
@@ -29,6 +47,33 @@ KST = timezone(timedelta(hours=9))
 # 서버 설정
 SERVER_URL = "http://ketiict.com:37211"  # 서버 주소
 DEVICE_ID = "raspberry-pi-001"
+HTTP_TIMEOUT = (1.0, 2.0)  # (연결, 응답) 제한 시간 (초)
+JSON_HEADERS = {"Content-Type": "application/json"}
+GZIP_MIN_BYTES = 512       # 이 크기보다 큰 로그 묶음은 gzip으로 압축해 전송
+
+# 로그 일괄 전송 설정
+DEFAULT_LOG_BATCH_SIZE = 20      # 한 번에 전송할 최대 로그 개수
+MAX_LOG_BATCH_SIZE = 100         # 서버가 한 요청에 받는 최대 로그 개수 (feedingLogBatchSchema)
+DEFAULT_LOG_FLUSH_INTERVAL = 2   # 로그를 모아 전송하는 최대 대기 시간 (초)
+
+# 메인 루프 최대 대기 시간 (초) - 시스템 시간 변경 등에 대비해 주기적으로 깨어남
+MAX_IDLE_SECONDS = 60
+
+# 서보 제어 스레드 실시간 설정
+REALTIME_PRIORITY = 50   # SCHED_FIFO 우선순위
+MCL_CURRENT = 1          # mlockall 플래그 (sys/mman.h)
+MCL_FUTURE = 2
+IO_THREAD_STACK_SIZE = 256 * 1024  # I/O 스레드 스택 크기 (mlockall로 잠기는 메모리 줄이기)
+
+# timerfd 설정 (linux/timerfd.h)
+TFD_TIMER_ABSTIME = 1
+TFD_CLOEXEC = 0o2000000
+
+# inotify 설정 (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
 
 # 로깅 설정
 logging.basicConfig(
@@ -42,65 +87,381 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _json_default(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"JSON으로 변환할 수 없는 타입: {type(obj).__name__}")
+
+
+def load_json(data):
+    """JSON 파싱 (orjson이 설치되어 있으면 사용)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(obj):
+    """JSON 직렬화 (bytes 반환, orjson이 설치되어 있으면 사용)
+
+    datetime 값은 ISO 8601 문자열로 변환된다.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, default=_json_default).encode('utf-8')
+
+
+def next_feeding_epoch(feeding_time, now=None):
+    """'HH:MM' 급여 시간의 다음 실행 시각(epoch 초)을 KST 기준으로 계산"""
+    now = now or datetime.now(KST)
+    hour, minute = map(int, feeding_time.split(':'))
+    target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return target.timestamp()
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+class _Itimerspec(ctypes.Structure):
+    _fields_ = [("it_interval", _Timespec), ("it_value", _Timespec)]
+
+
+class WallClockTimer:
+    """CLOCK_REALTIME 절대 시각에 만료되는 timerfd
+
+    커널 타이머가 만료될 때까지 select로 블록되므로 주기적으로 깨어날 필요가 없다.
+    """
+
+    def __init__(self):
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        fd = self._libc.timerfd_create(time.CLOCK_REALTIME, TFD_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "timerfd_create 실패")
+        self._fd = fd
+
+    def fileno(self):
+        return self._fd
+
+    def arm(self, deadline):
+        """epoch 초 기준 deadline에 만료되도록 설정"""
+        sec = int(deadline)
+        nsec = int((deadline - sec) * 1e9)
+        spec = _Itimerspec(_Timespec(0, 0), _Timespec(sec, nsec))
+        if self._libc.timerfd_settime(self._fd, TFD_TIMER_ABSTIME, ctypes.byref(spec), None) < 0:
+            raise OSError(ctypes.get_errno(), "timerfd_settime 실패")
+
+    def consume(self):
+        """만료 횟수를 읽어 타이머의 읽기 가능 상태 해제"""
+        os.read(self._fd, 8)
+
+    def close(self):
+        os.close(self._fd)
+
+
+class ConfigWatcher:
+    """inotify로 설정 파일 변경 감지
+
+    편집기가 임시 파일을 rename으로 교체하는 경우도 잡기 위해
+    파일이 있는 디렉토리를 감시하고 파일 이름으로 걸러낸다.
+    """
+
+    _EVENT = struct.Struct('iIII')  # wd, mask, cookie, len
+
+    def __init__(self, path):
+        path = Path(path).resolve()
+        self._name = os.fsencode(path.name)
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+        if self._libc.inotify_add_watch(fd, os.fsencode(path.parent), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, "inotify_add_watch 실패")
+        self._fd = fd
+
+    def fileno(self):
+        return self._fd
+
+    def changed(self):
+        """대기 중인 이벤트를 모두 읽고 설정 파일이 바뀌었으면 True 반환"""
+        changed = False
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = self._EVENT.unpack_from(data, offset)
+                offset += self._EVENT.size
+                if data[offset:offset + length].rstrip(b'\0') == self._name:
+                    changed = True
+                offset += length
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
 class ChickenFeederClient:
     def __init__(self, config_path='config.json'):
         """닭 먹이 급여기 클라이언트 초기화"""
         self.config_path = Path(config_path)
+        self._config_mtime = None
         self.config = self.load_config()
+        self._cache_config()
+        self._pi = None
         self.servo = None
         self.is_open = False
+        self._timers = []      # (다음 실행 시각 epoch 초, 급여 시간 "HH:MM") 최소 힙
+        self._close_at = None  # 급여 종료 예정 시각 (epoch 초)
+        self._timer = self.create_timer()
+        self._watcher = self.create_watcher()
+        self._stop_event = threading.Event()
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_w, False)
+        self._cleaned_up = False
+        self._session = self.create_session()
+        # 서보 제어 코어와 I/O 코어 분리 (I/O 스레드를 만들기 전에 결정)
+        self._control_cpu, self._io_cpus = self.split_cpus()
+        # 이후 만드는 스레드의 스택은 mlockall로 모두 잠기므로 기본 8MB 대신 작게 설정
+        threading.stack_size(IO_THREAD_STACK_SIZE)
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix='io',
+            initializer=self._init_io_thread
+        )
+        self._log_queue = queue.Queue()
+        self._log_thread = threading.Thread(target=self._log_flusher, daemon=True)
+        self._log_thread.start()
         self.setup_gpio()
+        atexit.register(self.cleanup)
         self.register_with_server()
 
     def load_config(self):
-        """설정 파일 로드"""
-        if not self.config_path.exists():
+        """설정 파일 로드 (마지막으로 읽은 뒤 수정되지 않았으면 기존 설정 반환)"""
+        try:
+            st = self.config_path.stat()
+        except FileNotFoundError:
             default_config = {
                 "feeding_times": ["07:00", "12:00", "18:00"],
                 "feeding_duration_minutes": 30,
+                "servo_type": DEFAULT_SERVO_TYPE,
                 "rotation_time": DEFAULT_ROTATION_TIME,
                 "servo_stop_duty": DEFAULT_STOP_DUTY,
                 "servo_cw_duty": DEFAULT_CW_DUTY,
                 "servo_ccw_duty": DEFAULT_CCW_DUTY,
                 "server_url": SERVER_URL,
-                "device_id": DEVICE_ID
+                "device_id": DEVICE_ID,
+                "log_batch_size": DEFAULT_LOG_BATCH_SIZE,
+                "log_flush_interval": DEFAULT_LOG_FLUSH_INTERVAL
             }
             with open(self.config_path, 'w') as f:
                 json.dump(default_config, f, indent=2)
             logger.info(f"기본 설정 파일 생성됨: {self.config_path}")
             return default_config
 
-        with open(self.config_path, 'r') as f:
-            config = json.load(f)
-            logger.info(f"설정 파일 로드됨: {config}")
-            return config
+        if st.st_mtime_ns == self._config_mtime:
+            logger.info("설정 파일 변경 없음")
+            return self.config
+
+        with open(self.config_path, 'rb') as f:
+            config = load_json(f.read())
+        self._config_mtime = st.st_mtime_ns
+        logger.info(f"설정 파일 로드됨: {config}")
+        return config
+
+    def _cache_config(self):
+        """자주 사용하는 설정 값을 속성으로 저장 (설정 로드 시마다 호출)"""
+        config = self.config
+        self.feeding_times = config.get('feeding_times', ["07:00", "12:00", "18:00"])
+        self.duration_minutes = config.get('feeding_duration_minutes', 30)
+        self.server_url = config.get('server_url', SERVER_URL)
+        self.device_id = config.get('device_id', DEVICE_ID)
+        self.log_batch_size = max(1, min(MAX_LOG_BATCH_SIZE,
+                                         config.get('log_batch_size', DEFAULT_LOG_BATCH_SIZE)))
+        self.log_flush_interval = config.get('log_flush_interval', DEFAULT_LOG_FLUSH_INTERVAL)
 
     def setup_gpio(self):
-        """GPIO 초기 설정"""
-        GPIO.setwarnings(False)
-        GPIO.setmode(GPIO.BOARD)
-        GPIO.setup(SERVO_PIN, GPIO.OUT)
-        self.servo = GPIO.PWM(SERVO_PIN, 50)
-        self.servo.start(0)
+        """GPIO 초기 설정 (pigpiod 데몬의 DMA 기반 펄스 생성 사용)"""
+        self._pi = pigpio.pi()
+        if not self._pi.connected:
+            raise RuntimeError("pigpiod에 연결할 수 없습니다 (sudo systemctl start pigpiod)")
+        self.servo = self.create_servo()
+        self.servo.stop()
         logger.info("GPIO 설정 완료")
 
+    def create_servo(self):
+        """설정의 servo_type에 맞는 서보 제어 객체 생성"""
+        config = self.config
+        servo_type = config.get('servo_type', DEFAULT_SERVO_TYPE)
+
+        if servo_type == 'continuous':
+            return ContinuousServo(
+                self._pi,
+                stop_duty=config.get('servo_stop_duty', DEFAULT_STOP_DUTY),
+                cw_duty=config.get('servo_cw_duty', DEFAULT_CW_DUTY),
+                ccw_duty=config.get('servo_ccw_duty', DEFAULT_CCW_DUTY),
+                rotation_time=config.get('rotation_time', DEFAULT_ROTATION_TIME)
+            )
+        if servo_type == 'positional':
+            return PositionalServo(
+                self._pi,
+                min_duty=config.get('servo_min_duty', DEFAULT_MIN_DUTY),
+                max_duty=config.get('servo_max_duty', DEFAULT_MAX_DUTY),
+                open_angle=config.get('open_angle', DEFAULT_OPEN_ANGLE),
+                close_angle=config.get('close_angle', DEFAULT_CLOSE_ANGLE),
+                move_time=config.get('move_time', DEFAULT_MOVE_TIME)
+            )
+        raise ValueError(f"알 수 없는 servo_type: {servo_type}")
+
+    def create_timer(self):
+        """급여 시각 대기용 타이머 생성 (timerfd를 쓸 수 없으면 None)"""
+        try:
+            return WallClockTimer()
+        except (OSError, AttributeError) as e:
+            logger.warning(f"timerfd 사용 불가, sleep으로 대기: {e}")
+            return None
+
+    def create_watcher(self):
+        """설정 파일 변경 감시자 생성 (inotify를 쓸 수 없으면 None)"""
+        try:
+            return ConfigWatcher(self.config_path)
+        except (OSError, AttributeError) as e:
+            logger.warning(f"inotify 사용 불가, 설정 파일 자동 재로드 비활성화: {e}")
+            return None
+
+    def wait_for_next_job(self):
+        """다음 급여 작업 시각까지 대기 (설정 파일이 바뀌면 재로드)"""
+        deadline = time.time() + MAX_IDLE_SECONDS
+        if self._timers:
+            deadline = min(deadline, self._timers[0][0])
+        if self._close_at is not None:
+            deadline = min(deadline, self._close_at)
+
+        # 타이머 만료, 설정 파일 변경 또는 종료 요청(stop) 시 깨어남
+        rlist = [self._wakeup_r]
+        if self._watcher is not None:
+            rlist.append(self._watcher)
+        timeout = max(0, deadline - time.time())
+        if self._timer is not None:
+            self._timer.arm(deadline)
+            rlist.append(self._timer)
+            timeout = None
+
+        readable, _, _ = select.select(rlist, [], [], timeout)
+        if self._timer in readable:
+            self._timer.consume()
+        if self._wakeup_r in readable:
+            os.read(self._wakeup_r, 64)
+        if self._watcher in readable and self._watcher.changed():
+            try:
+                self.reload_config()
+            except Exception as e:
+                logger.error(f"설정 파일 재로드 실패: {e}")
+
+    def stop(self):
+        """메인 루프 종료 요청 (시그널 핸들러 및 다른 스레드에서 호출 가능)"""
+        self._stop_event.set()
+        try:
+            os.write(self._wakeup_w, b'\0')
+        except BlockingIOError:
+            pass
+
+    def handle_signal(self, sig, frame):
+        """시그널 핸들러"""
+        logger.info("종료 신호 받음")
+        self.stop()
+
+    def split_cpus(self):
+        """(서보 제어 CPU, I/O 스레드 CPU 집합) 반환
+
+        마지막 CPU 코어를 서보 제어에 쓰고 나머지를 I/O 스레드에 쓴다.
+        코어가 하나뿐이면 (None, None)을 반환한다.
+        """
+        cpus = os.sched_getaffinity(0)
+        if len(cpus) > 1:
+            control_cpu = max(cpus)
+            return control_cpu, cpus - {control_cpu}
+        return None, None
+
+    def setup_realtime(self):
+        """서보 제어(메인) 스레드 실시간 설정
+
+        마지막 CPU 코어에 고정하고, 메모리를 잠가 페이지 폴트를 막고,
+        SCHED_FIFO로 우선순위를 높인다. 권한이 없으면 경고만 남긴다.
+        """
+        if self._control_cpu is not None:
+            os.sched_setaffinity(0, {self._control_cpu})
+            logger.info(f"서보 제어 스레드 CPU {self._control_cpu}번에 고정")
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+            logger.warning(f"mlockall 실패: {os.strerror(ctypes.get_errno())} (LimitMEMLOCK 확인)")
+
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(REALTIME_PRIORITY))
+        except PermissionError:
+            logger.warning("SCHED_FIFO 설정 권한 없음 (root 실행 또는 LimitRTPRIO/CAP_SYS_NICE 필요)")
+
+    def _init_io_thread(self):
+        """I/O 스레드를 서보 제어 코어 밖에서 일반 스케줄링으로 실행"""
+        if self._io_cpus:
+            os.sched_setaffinity(0, self._io_cpus)
+        try:
+            os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+        except OSError:
+            pass
+
+    def create_session(self):
+        """서버 통신용 HTTP 세션 생성 (연결 재사용 및 일시적 오류 재시도)"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _post_json(self, path, data, compress=False):
+        """서버로 JSON POST 요청 전송
+
+        compress가 True이고 본문이 GZIP_MIN_BYTES보다 크면 gzip으로 압축한다.
+        """
+        body = dump_json(data)
+        headers = JSON_HEADERS
+        if compress and len(body) > GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            headers = {**JSON_HEADERS, "Content-Encoding": "gzip"}
+
+        return self._session.post(
+            f"{self.server_url}{path}",
+            data=body,
+            headers=headers,
+            timeout=HTTP_TIMEOUT
+        )
+
     def register_with_server(self):
+        """서버에 장치 등록 요청 (I/O 스레드에서 전송)"""
+        self._io_pool.submit(self._do_register)
+
+    def _do_register(self):
         """서버에 장치 등록 및 설정 업데이트"""
         try:
-            server_url = self.config.get('server_url', SERVER_URL)
-            device_id = self.config.get('device_id', DEVICE_ID)
+            device_id = self.device_id
 
             data = {
                 "device_id": device_id,
-                "feeding_times": self.config.get('feeding_times', ["07:00", "12:00", "18:00"]),
-                "duration_minutes": self.config.get('feeding_duration_minutes', 30)
+                "feeding_times": self.feeding_times,
+                "duration_minutes": self.duration_minutes
             }
 
-            response = requests.post(
-                f"{server_url}/api/device/config",
-                json=data,
-                timeout=5
-            )
+            response = self._post_json("/api/device/config", data)
 
             if response.status_code == 200:
                 logger.info(f"서버에 장치 등록 완료: {device_id}")
@@ -110,112 +471,134 @@ class ChickenFeederClient:
         except Exception as e:
             logger.error(f"서버 등록 중 오류: {e}")
 
-    def send_log_to_server(self, action, details=None):
-        """서버로 로그 전송"""
-        try:
-            server_url = self.config.get('server_url', SERVER_URL)
-            device_id = self.config.get('device_id', DEVICE_ID)
+    def send_log_to_server(self, action, details=None, timestamp=None):
+        """서버로 보낼 로그를 전송 큐에 추가 (전송은 백그라운드 스레드에서 수행)
+
+        Args:
+            action: 이벤트 종류 ('open', 'close', 'error', 'startup', 'shutdown')
+            details: 추가 정보 딕셔너리
+            timestamp: 이벤트 시각 (지정하지 않으면 현재 KST 시각)
+        """
+        self._log_queue.put_nowait({
+            "action": action,
+            "timestamp": timestamp or datetime.now(KST),
+            "details": details or {}
+        })
+
+    def _log_flusher(self):
+        """로그 큐를 비우며 서버로 일괄 전송
 
+        로그가 log_batch_size개 모이거나 첫 로그 이후 log_flush_interval초가
+        지나면 한 번의 요청으로 전송한다. 큐에 None이 들어오면 남은 로그를
+        전송한 뒤 종료한다.
+        """
+        self._init_io_thread()
+        running = True
+        while running:
+            event = self._log_queue.get()
+            if event is None:
+                break
+
+            batch = [event]
+            deadline = time.monotonic() + self.log_flush_interval
+            while len(batch) < self.log_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event = self._log_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if event is None:
+                    running = False
+                    break
+                batch.append(event)
+
+            self._post_log_batch(batch)
+
+    def _post_log_batch(self, batch):
+        """모아둔 로그를 서버로 전송"""
+        try:
             data = {
-                "device_id": device_id,
-                "action": action,
-                "timestamp": datetime.now(KST).isoformat(),
-                "details": details or {}
+                "device_id": self.device_id,
+                "events": batch
             }
 
-            response = requests.post(
-                f"{server_url}/api/feeding/log",
-                json=data,
-                timeout=5
-            )
+            response = self._post_json("/api/feeding/log/batch", data, compress=True)
 
             if response.status_code != 200:
-                logger.warning(f"로그 전송 실패: {response.status_code}")
+                logger.warning(f"로그 전송 실패: {response.status_code} ({len(batch)}개)")
 
         except Exception as e:
             logger.error(f"로그 전송 중 오류: {e}")
 
-    def rotate_servo(self, direction, duration):
-        """연속 회전 서보 모터 제어
-
-        Args:
-            direction: 'cw' (시계방향/열기) 또는 'ccw' (반시계방향/닫기)
-            duration: 회전 시간 (초)
-        """
-        stop_duty = self.config.get('servo_stop_duty', DEFAULT_STOP_DUTY)
-        cw_duty = self.config.get('servo_cw_duty', DEFAULT_CW_DUTY)
-        ccw_duty = self.config.get('servo_ccw_duty', DEFAULT_CCW_DUTY)
-
-        if direction == 'cw':
-            duty = cw_duty
-        elif direction == 'ccw':
-            duty = ccw_duty
-        else:
-            duty = stop_duty
-
-        logger.debug(f"서보 회전: {direction}, Duty: {duty}, 시간: {duration}초")
-
-        self.servo.ChangeDutyCycle(duty)
-        time.sleep(duration)
-        self.servo.ChangeDutyCycle(stop_duty)  # 정지
-        time.sleep(0.1)
-        self.servo.ChangeDutyCycle(0)  # PWM 신호 끄기 (떨림 방지)
-
-    def open_feeder(self):
-        """먹이통 열기 - 시계방향으로 10바퀴 회전"""
+    def open_feeder(self, timestamp=None):
+        """먹이통 열기"""
         if not self.is_open:
-            rotation_time = self.config.get('rotation_time', DEFAULT_ROTATION_TIME)
-            logger.info(f"먹이통 열기 - 시계방향 {rotation_time}초 회전")
+            logger.info("먹이통 열기")
 
             try:
-                self.rotate_servo('cw', rotation_time)
+                details = self.servo.move_open()
                 self.is_open = True
-                self.send_log_to_server("open", {"rotation_time": rotation_time})
+                self.send_log_to_server("open", details, timestamp)
             except Exception as e:
                 logger.error(f"먹이통 열기 실패: {e}")
-                self.send_log_to_server("error", {"message": str(e)})
+                self.send_log_to_server("error", {"message": str(e)}, timestamp)
 
-    def close_feeder(self):
-        """먹이통 닫기 - 반시계방향으로 10바퀴 회전"""
+    def close_feeder(self, timestamp=None):
+        """먹이통 닫기"""
         if self.is_open:
-            rotation_time = self.config.get('rotation_time', DEFAULT_ROTATION_TIME)
-            logger.info(f"먹이통 닫기 - 반시계방향 {rotation_time}초 회전")
+            logger.info("먹이통 닫기")
 
             try:
-                self.rotate_servo('ccw', rotation_time)
+                details = self.servo.move_close()
                 self.is_open = False
-                self.send_log_to_server("close", {"rotation_time": rotation_time})
+                self.send_log_to_server("close", details, timestamp)
             except Exception as e:
                 logger.error(f"먹이통 닫기 실패: {e}")
-                self.send_log_to_server("error", {"message": str(e)})
+                self.send_log_to_server("error", {"message": str(e)}, timestamp)
 
     def feeding_job(self):
         """급여 작업 실행"""
         now = datetime.now(KST)
-        logger.info(f"급여 시작 - {now.strftime('%Y-%m-%d %H:%M:%S KST')}")
-        self.open_feeder()
+        logger.info(f"급여 시작 - {now:%Y-%m-%d %H:%M:%S} KST")
+        self.open_feeder(now)
 
-        duration = self.config.get('feeding_duration_minutes', 30)
-        schedule.enter(duration * 60, 1, self.close_feeding_job)
+        # 급여 시간이 끝나면 메인 루프에서 닫기 (이전 급여의 닫기 예약은 대체)
+        self._close_at = time.time() + self.duration_minutes * 60
 
     def close_feeding_job(self):
         """급여 종료 작업"""
         now = datetime.now(KST)
-        logger.info(f"급여 종료 - {now.strftime('%Y-%m-%d %H:%M:%S KST')}")
-        self.close_feeder()
+        logger.info(f"급여 종료 - {now:%Y-%m-%d %H:%M:%S} KST")
+        self.close_feeder(now)
 
     def schedule_feedings(self):
         """급여 스케줄 설정"""
-        schedule.clear()
+        self._timers = []
 
-        for feeding_time in self.config.get('feeding_times', []):
-            schedule.every().day.at(feeding_time).do(self.feeding_job)
+        for feeding_time in self.feeding_times:
+            heapq.heappush(self._timers, (next_feeding_epoch(feeding_time), feeding_time))
             logger.info(f"급여 시간 등록: {feeding_time} KST")
 
+    def run_pending(self):
+        """실행 시각이 지난 급여 시작/종료 작업 실행"""
+        now = time.time()
+        while self._timers and self._timers[0][0] <= now:
+            _, feeding_time = heapq.heappop(self._timers)
+            heapq.heappush(self._timers, (next_feeding_epoch(feeding_time), feeding_time))
+            self.feeding_job()
+
+        if self._close_at is not None and time.time() >= self._close_at:
+            self._close_at = None
+            self.close_feeding_job()
+
     def reload_config(self):
         """설정 파일 다시 로드"""
         logger.info("설정 파일 재로드 중...")
         self.config = self.load_config()
+        self._cache_config()
+        self.servo = self.create_servo()
         self.schedule_feedings()
         self.register_with_server()
         logger.info("설정 파일 재로드 완료")
@@ -223,15 +606,16 @@ class ChickenFeederClient:
     def run(self):
         """메인 실행 루프"""
         logger.info("닭 먹이 자동 급여 시스템 시작 (서버 연동 모드)")
+        self.setup_realtime()
         logger.info(f"현재 시간: {datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S KST')}")
-        logger.info(f"서버 URL: {self.config.get('server_url', SERVER_URL)}")
-        logger.info(f"장치 ID: {self.config.get('device_id', DEVICE_ID)}")
+        logger.info(f"서버 URL: {self.server_url}")
+        logger.info(f"장치 ID: {self.device_id}")
 
         # 시작 로그 전송
         self.send_log_to_server("startup", {
             "config": {
-                "feeding_times": self.config.get('feeding_times'),
-                "duration_minutes": self.config.get('feeding_duration_minutes')
+                "feeding_times": self.feeding_times,
+                "duration_minutes": self.duration_minutes
             }
         })
 
@@ -242,9 +626,9 @@ class ChickenFeederClient:
         self.close_feeder()
 
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(10)
+            while not self._stop_event.is_set():
+                self.run_pending()
+                self.wait_for_next_job()
 
         except KeyboardInterrupt:
             logger.info("프로그램 종료 신호 받음")
@@ -252,29 +636,38 @@ class ChickenFeederClient:
             self.cleanup()
 
     def cleanup(self):
-        """GPIO 정리"""
+        """GPIO 정리 (run 종료 시 및 atexit에서 호출, 한 번만 실행)"""
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
         logger.info("시스템 종료 중...")
 
         # 종료 로그 전송
         self.send_log_to_server("shutdown", {})
 
         self.close_feeder()
-        time.sleep(1)
         self.servo.stop()
-        GPIO.cleanup()
+        self._pi.stop()
+
+        # 진행 중인 서버 요청 및 남은 로그 전송 후 종료
+        self._io_pool.shutdown(wait=True)
+        self._log_queue.put(None)
+        self._log_thread.join(timeout=10)
+        self._session.close()
+        if self._timer is not None:
+            self._timer.close()
+        if self._watcher is not None:
+            self._watcher.close()
+        os.close(self._wakeup_r)
+        os.close(self._wakeup_w)
         logger.info("GPIO 정리 완료. 프로그램 종료.")
 
 
-def signal_handler(sig, frame):
-    """시그널 핸들러"""
-    logger.info("종료 신호 받음")
-    sys.exit(0)
-
-
 if __name__ == "__main__":
-    # SIGTERM 시그널 핸들러 등록
-    signal.signal(signal.SIGTERM, signal_handler)
-
     # 먹이 급여기 클라이언트 실행
     feeder = ChickenFeederClient()
+
+    # SIGTERM 시그널 핸들러 등록
+    signal.signal(signal.SIGTERM, feeder.handle_signal)
+
     feeder.run()
\ No newline at end of file
@@ -5,7 +5,11 @@ echo "======================================================="
 
 # 필요한 패키지 설치
 echo "필수 패키지 설치 중..."
-pip3 install RPi.GPIO schedule requests
+sudo apt-get install -y pigpio
+pip3 install pigpio RPi.GPIO requests orjson
+
+# pigpio 데몬 활성화 (서보 펄스 생성)
+sudo systemctl enable --now pigpiod
 
 # 로그 디렉토리 생성
 sudo mkdir -p /var/log
@@ -57,6 +57,15 @@ const feedingLogSchema = Joi.object({
   details: Joi.object().optional()
 });
 
+const feedingLogBatchSchema = Joi.object({
+  device_id: Joi.string().required(),
+  events: Joi.array().items(Joi.object({
+    action: Joi.string().valid('open', 'close', 'error', 'startup', 'shutdown').required(),
+    timestamp: Joi.date().iso().required(),
+    details: Joi.object().optional()
+  })).min(1).max(100).required()
+});
+
 const configUpdateSchema = Joi.object({
   device_id: Joi.string().required(),
   feeding_times: Joi.array().items(Joi.string().pattern(/^([01]\d|2[0-3]):([0-5]\d)$/)).required(),
@@ -131,6 +140,38 @@ app.post('/api/feeding/log', async (req, res) => {
   }
 });
 
+// Log multiple feeding events in one request
+app.post('/api/feeding/log/batch', async (req, res) => {
+  try {
+    const { error } = feedingLogBatchSchema.validate(req.body);
+    if (error) {
+      return res.status(400).json({ error: error.details[0].message });
+    }
+
+    const { device_id, events } = req.body;
+
+    const values = [];
+    const params = [];
+    events.forEach((event, i) => {
+      const base = i * 4;
+      values.push(`($${base + 1}, $${base + 2}, $${base + 3}, $${base + 4})`);
+      params.push(device_id, event.action, event.timestamp, event.details || {});
+    });
+
+    await pool.query(
+      `INSERT INTO feeding_logs (device_id, action, timestamp, details)
+       VALUES ${values.join(', ')}`,
+      params
+    );
+
+    logger.info(`Feeding events logged: ${device_id} - ${events.length} events`);
+    res.json({ success: true, count: events.length });
+  } catch (error) {
+    logger.error('Error logging feeding events:', error);
+    res.status(500).json({ error: 'Internal server error' });
+  }
+});
+
 // Get feeding logs
 app.get('/api/feeding/logs/:device_id', async (req, res) => {
   try {
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+먹이통 서보모터 제어
+연속 회전 서보와 각도 제어 서보를 같은 인터페이스(move_open/move_close/stop)로 제공
+pigpiod 데몬의 DMA 기반 펄스 생성을 사용
+"""
+
+import math
+import time
+import logging
+from abc import ABC, abstractmethod
+
+SERVO_GPIO = 18              # BCM 번호 (물리적 핀 12, 하드웨어 PWM0)
+PWM_FREQUENCY = 50           # 서보 PWM 주파수 (Hz)
+
+# 연속 회전 서보 기본값
+DEFAULT_STOP_DUTY = 7.5      # 정지
+DEFAULT_CW_DUTY = 9.75       # 시계방향 (열기) - 절반 속도
+DEFAULT_CCW_DUTY = 5.25      # 반시계방향 (닫기) - 절반 속도
+DEFAULT_ROTATION_TIME = 10   # 10바퀴 회전에 필요한 시간 (초)
+
+# 각도 제어 서보 기본값
+DEFAULT_MIN_DUTY = 2.5       # 0도
+DEFAULT_MAX_DUTY = 12.5      # 180도
+DEFAULT_OPEN_ANGLE = 90      # 열림 각도
+DEFAULT_CLOSE_ANGLE = 0      # 닫힘 각도
+DEFAULT_MOVE_TIME = 0.5      # 목표 각도 도달 대기 시간 (초)
+
+# 각도 제어 서보 S-curve 가감속 설정
+RAMP_STEPS = 32              # 가감속 구간을 나누는 단계 수
+RAMP_MIN_ANGLE = 20          # 이보다 작은 이동은 가감속 없이 바로 이동 (도)
+RAMP_SETTLE_TIME = 0.1       # 가감속이 끝난 뒤 목표 각도를 유지하는 시간 (초, PWM 5주기)
+
+# 0 -> 1로 부드럽게 변하는 S-curve (코사인 보간)
+_S_CURVE = [0.5 * (1 - math.cos(math.pi * i / (RAMP_STEPS - 1))) for i in range(RAMP_STEPS)]
+
+logger = logging.getLogger(__name__)
+
+
+def duty_to_pulsewidth(duty):
+    """duty(%) 값을 서보 펄스 폭(마이크로초)으로 변환"""
+    return int(round(duty * 10000 / PWM_FREQUENCY))
+
+
+def precise_sleep(seconds):
+    """CLOCK_MONOTONIC 기준으로 지정 시간 대기
+
+    대부분은 time.sleep으로 쉬고 마지막 2ms만 바쁜 대기하여
+    커널 깨우기 지연으로 인한 오차를 줄인다.
+    """
+    deadline = time.monotonic_ns() + int(seconds * 1e9)
+    coarse = deadline - 2_000_000
+    remaining = coarse - time.monotonic_ns()
+    if remaining > 0:
+        time.sleep(remaining / 1e9)
+    while time.monotonic_ns() < deadline:
+        pass
+
+
+class ServoController(ABC):
+    """먹이통 서보 제어 기본 클래스
+
+    move_open/move_close는 동작을 마친 뒤 서버 로그에 기록할 정보를 반환한다.
+    """
+
+    def __init__(self, pi, gpio=SERVO_GPIO):
+        self._pi = pi
+        self.gpio = gpio
+
+    def set_pulsewidth(self, pulse):
+        """펄스 폭(마이크로초) 출력, 0이면 펄스 출력 끄기"""
+        self._pi.set_servo_pulsewidth(self.gpio, pulse)
+
+    @abstractmethod
+    def move_open(self):
+        """먹이통 열기"""
+
+    @abstractmethod
+    def move_close(self):
+        """먹이통 닫기"""
+
+    def stop(self):
+        """펄스 출력 끄기 (떨림 방지)"""
+        self.set_pulsewidth(0)
+
+
+class ContinuousServo(ServoController):
+    """연속 회전 서보 - 지정 시간 동안 회전하여 먹이통 개폐"""
+
+    def __init__(self, pi, stop_duty=DEFAULT_STOP_DUTY, cw_duty=DEFAULT_CW_DUTY,
+                 ccw_duty=DEFAULT_CCW_DUTY, rotation_time=DEFAULT_ROTATION_TIME,
+                 gpio=SERVO_GPIO):
+        super().__init__(pi, gpio)
+        self.rotation_time = rotation_time
+
+        # 방향별 펄스 폭(마이크로초)을 미리 계산
+        self.stop_pulse = duty_to_pulsewidth(stop_duty)
+        self._pulse_table = {
+            'cw': duty_to_pulsewidth(cw_duty),
+            'ccw': duty_to_pulsewidth(ccw_duty),
+            'stop': self.stop_pulse
+        }
+
+    def rotate(self, direction, duration):
+        """연속 회전 서보 모터 제어
+
+        Args:
+            direction: 'cw' (시계방향/열기) 또는 'ccw' (반시계방향/닫기)
+            duration: 회전 시간 (초)
+        """
+        pulse = self._pulse_table.get(direction, self.stop_pulse)
+
+        logger.debug(f"서보 회전: {direction}, 펄스: {pulse}us, 시간: {duration}초")
+
+        self.set_pulsewidth(pulse)
+        precise_sleep(duration)
+        self.set_pulsewidth(self.stop_pulse)  # 정지
+        precise_sleep(0.1)
+        self.stop()
+
+    def move_open(self):
+        """시계방향으로 rotation_time초 회전"""
+        logger.info(f"시계방향 {self.rotation_time}초 회전")
+        self.rotate('cw', self.rotation_time)
+        return {"rotation_time": self.rotation_time}
+
+    def move_close(self):
+        """반시계방향으로 rotation_time초 회전"""
+        logger.info(f"반시계방향 {self.rotation_time}초 회전")
+        self.rotate('ccw', self.rotation_time)
+        return {"rotation_time": self.rotation_time}
+
+
+class PositionalServo(ServoController):
+    """각도 제어 서보 (SG90 등) - 열림/닫힘 각도로 이동하여 먹이통 개폐"""
+
+    def __init__(self, pi, min_duty=DEFAULT_MIN_DUTY, max_duty=DEFAULT_MAX_DUTY,
+                 open_angle=DEFAULT_OPEN_ANGLE, close_angle=DEFAULT_CLOSE_ANGLE,
+                 move_time=DEFAULT_MOVE_TIME, gpio=SERVO_GPIO):
+        super().__init__(pi, gpio)
+        self.open_angle = open_angle
+        self.close_angle = close_angle
+        self.move_time = move_time
+        self._angle = None  # 마지막으로 이동한 각도 (시작 직후에는 알 수 없음)
+
+        # 0~180도 각도별 펄스 폭(마이크로초)을 미리 계산
+        self._pulse_table = [
+            duty_to_pulsewidth(min_duty + (max_duty - min_duty) * angle / 180.0)
+            for angle in range(181)
+        ]
+
+    def set_angle(self, angle):
+        """서보를 지정 각도(0~180도)로 이동
+
+        이전 각도에서 RAMP_MIN_ANGLE보다 크게 움직이면 move_time 동안
+        S-curve로 가감속하여 기구에 가해지는 충격을 줄인다. 가감속 뒤에는
+        서보가 목표 각도에 도달하도록 RAMP_SETTLE_TIME 동안 펄스를 유지한다.
+        """
+        angle = max(0, min(180, int(angle)))
+        pulse = self._pulse_table[angle]
+
+        logger.debug(f"서보 이동: {angle}도, 펄스: {pulse}us")
+
+        if self._angle is not None and abs(angle - self._angle) > RAMP_MIN_ANGLE:
+            start = self._pulse_table[self._angle]
+            delta = pulse - start
+            step_time = self.move_time / RAMP_STEPS
+            for ratio in _S_CURVE:
+                self.set_pulsewidth(int(start + delta * ratio))
+                precise_sleep(step_time)
+            self.set_pulsewidth(pulse)
+            precise_sleep(RAMP_SETTLE_TIME)
+        else:
+            self.set_pulsewidth(pulse)
+            precise_sleep(self.move_time)
+
+        self._angle = angle
+        self.stop()
+
+    def move_open(self):
+        """열림 각도로 이동"""
+        logger.info(f"{self.open_angle}도로 이동")
+        self.set_angle(self.open_angle)
+        return {"angle": self.open_angle}
+
+    def move_close(self):
+        """닫힘 각도로 이동"""
+        logger.info(f"{self.close_angle}도로 이동")
+        self.set_angle(self.close_angle)
+        return {"angle": self.close_angle}
@@ -6,154 +6,307 @@ config.json에서 설정을 읽어옵니다.
 """
 
 import RPi.GPIO as GPIO
+import atexit
+import os
 import time
 import sys
-import json
+import selectors
+from collections import namedtuple
 from pathlib import Path
 
-SERVO_PIN = 12
-
-# 기본값
-DEFAULT_STOP_DUTY = 7.5
-DEFAULT_CW_DUTY = 9.75
-DEFAULT_CCW_DUTY = 5.25
-DEFAULT_ROTATION_TIME = 10
-
-def load_config():
-    """config.json에서 설정 로드"""
-    config_path = Path(__file__).parent / 'config.json'
-    if config_path.exists():
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-            print(f"설정 파일 로드됨: {config_path}")
-            return config
-    print("설정 파일이 없어 기본값 사용")
-    return {}
+from servo import (
+    precise_sleep,
+    DEFAULT_STOP_DUTY, DEFAULT_CW_DUTY, DEFAULT_CCW_DUTY, DEFAULT_ROTATION_TIME
+)
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+SERVO_PIN = 12  # 물리적 핀 번호 (GPIO.BOARD)
+IDLE_TICK = 0.1  # 명령 입력을 기다리는 동안 주기 작업 간격 (초)
+_PROMPT_BYTES = "명령 입력> ".encode('utf-8')  # 미리 인코딩한 입력 프롬프트
+
+_CONFIG_PATH = Path(__file__).resolve().parent / 'config.json'
+_CONFIG_PATH_STR = str(_CONFIG_PATH)
+
+# 마지막으로 읽은 config.json (수정 시각/크기가 같으면 다시 읽지 않고,
+# 다시 읽더라도 내용이 같으면 파싱하지 않음)
+_CONFIG_CACHE = {"mtime": None, "size": None, "raw": None, "data": {}}
+
+def load_config(force=False):
+    """config.json에서 설정 로드
+
+    Args:
+        force: True이면 파일이 바뀌지 않았어도 다시 읽음
+    """
+    try:
+        st = os.stat(_CONFIG_PATH_STR)
+        if (not force and st.st_mtime_ns == _CONFIG_CACHE["mtime"]
+                and st.st_size == _CONFIG_CACHE["size"]):
+            return _CONFIG_CACHE["data"]
+
+        with open(_CONFIG_PATH_STR, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        print("설정 파일이 없어 기본값 사용")
+        return {}
+
+    if raw == _CONFIG_CACHE["raw"]:
+        _CONFIG_CACHE.update(mtime=st.st_mtime_ns, size=st.st_size)
+        return _CONFIG_CACHE["data"]
+
+    # 파싱에 성공한 경우에만 캐시 갱신 (잘못된 파일은 다음 호출에서도 오류)
+    config = _loads(raw)
+    _CONFIG_CACHE.update(mtime=st.st_mtime_ns, size=st.st_size, raw=raw, data=config)
+    print(f"설정 파일 로드됨: {_CONFIG_PATH}")
+    return config
+
+# config.json에서 한 번만 읽어 둔 서보 설정
+# (*_msg: 회전 시 출력할 메시지, duty 값까지 미리 포맷)
+ServoParams = namedtuple(
+    "ServoParams",
+    "stop_duty cw_duty ccw_duty rotation_time cw_msg ccw_msg stop_msg"
+)
+
+def build_params(config):
+    """설정 딕셔너리에서 서보 설정 생성 (기본값 적용)"""
+    stop_duty = config.get('servo_stop_duty', DEFAULT_STOP_DUTY)
+    cw_duty = config.get('servo_cw_duty', DEFAULT_CW_DUTY)
+    ccw_duty = config.get('servo_ccw_duty', DEFAULT_CCW_DUTY)
+    return ServoParams(
+        stop_duty=stop_duty,
+        cw_duty=cw_duty,
+        ccw_duty=ccw_duty,
+        rotation_time=config.get('rotation_time', DEFAULT_ROTATION_TIME),
+        cw_msg=f"시계방향 회전 (Duty: {cw_duty})",
+        ccw_msg=f"반시계방향 회전 (Duty: {ccw_duty})",
+        stop_msg=f"정지 (Duty: {stop_duty})"
+    )
+
+def _cleanup(servo, _gpio_cleanup=GPIO.cleanup):
+    """PWM 끄고 GPIO 정리 (종료 시 atexit에서 호출)"""
+    servo.ChangeDutyCycle(0)
+    servo.stop()
+    _gpio_cleanup()
+    print("GPIO 정리 완료")
 
 def setup_gpio():
-    """GPIO 설정"""
+    """GPIO 설정 (정리 작업은 atexit에 등록)"""
     GPIO.setwarnings(False)
     GPIO.setmode(GPIO.BOARD)
     GPIO.setup(SERVO_PIN, GPIO.OUT)
     servo = GPIO.PWM(SERVO_PIN, 50)
     servo.start(0)
+    atexit.register(_cleanup, servo)
     return servo
 
-def rotate_servo(servo, direction, duration, config):
+def _stop_servo(cdc, stop_duty):
+    """정지 duty를 0.1초 출력한 뒤 PWM 신호 끄기 (cdc: servo.ChangeDutyCycle)"""
+    cdc(stop_duty)  # 정지
+    precise_sleep(0.1)
+    cdc(0)  # PWM 신호 끄기
+
+def _apply_duty(servo, duty, duration, stop_duty):
+    """duty를 duration초 동안 출력한 뒤 정지하고 PWM 신호 끄기"""
+    cdc = servo.ChangeDutyCycle
+    cdc(duty)
+    precise_sleep(duration)
+    _stop_servo(cdc, stop_duty)
+
+def rotate_servo(servo, direction, duration, params):
     """연속 회전 서보 제어
 
     Args:
         servo: PWM 객체
         direction: 'cw' (시계방향), 'ccw' (반시계방향), 'stop' (정지)
         duration: 회전 시간 (초)
-        config: 설정 딕셔너리
+        params: ServoParams
     """
-    stop_duty = config.get('servo_stop_duty', DEFAULT_STOP_DUTY)
-    cw_duty = config.get('servo_cw_duty', DEFAULT_CW_DUTY)
-    ccw_duty = config.get('servo_ccw_duty', DEFAULT_CCW_DUTY)
-
     if direction == 'cw':
-        duty = cw_duty
-        print(f"시계방향 회전 (Duty: {duty}) - {duration}초")
+        duty = params.cw_duty
+        print(f"{params.cw_msg} - {duration}초")
     elif direction == 'ccw':
-        duty = ccw_duty
-        print(f"반시계방향 회전 (Duty: {duty}) - {duration}초")
+        duty = params.ccw_duty
+        print(f"{params.ccw_msg} - {duration}초")
     else:
-        duty = stop_duty
-        print(f"정지 (Duty: {duty})")
+        duty = params.stop_duty
+        print(params.stop_msg)
 
-    servo.ChangeDutyCycle(duty)
-    time.sleep(duration)
-    servo.ChangeDutyCycle(stop_duty)  # 정지
-    time.sleep(0.1)
-    servo.ChangeDutyCycle(0)  # PWM 신호 끄기
+    _apply_duty(servo, duty, duration, params.stop_duty)
 
-def main():
-    """메인 테스트 함수"""
-    config = load_config()
-    rotation_time = config.get('rotation_time', DEFAULT_ROTATION_TIME)
-    stop_duty = config.get('servo_stop_duty', DEFAULT_STOP_DUTY)
+_BANNER_TEMPLATE = """
+연속 회전 서보모터 테스트 프로그램
+==================================
+현재 설정: rotation_time={rotation_time}초, cw_duty={cw_duty}, ccw_duty={ccw_duty}
 
-    print()
-    print("연속 회전 서보모터 테스트 프로그램")
-    print("==================================")
-    print(f"현재 설정: rotation_time={rotation_time}초, "
-          f"cw_duty={config.get('servo_cw_duty', DEFAULT_CW_DUTY)}, "
-          f"ccw_duty={config.get('servo_ccw_duty', DEFAULT_CCW_DUTY)}")
-    print()
-    print("명령어:")
-    print(f"  open: 시계방향 {rotation_time}초 회전 (먹이통 열기)")
-    print(f"  close: 반시계방향 {rotation_time}초 회전 (먹이통 닫기)")
-    print("  cw [초]: 시계방향으로 지정 시간 회전")
-    print("  ccw [초]: 반시계방향으로 지정 시간 회전")
-    print("  stop: 모터 정지")
-    print("  test: 전체 동작 테스트")
-    print("  reload: 설정 다시 로드")
-    print("  quit: 종료")
-    print()
+명령어:
+  open: 시계방향 {rotation_time}초 회전 (먹이통 열기)
+  close: 반시계방향 {rotation_time}초 회전 (먹이통 닫기)
+  cw [초]: 시계방향으로 지정 시간 회전
+  ccw [초]: 반시계방향으로 지정 시간 회전
+  stop: 모터 정지
+  test: 전체 동작 테스트
+  reload: 설정 다시 로드
+  quit: 종료
 
-    servo = setup_gpio()
+"""
+
+# 명령어 처리 함수: (servo, params, arg)를 받아 이후 사용할 params 반환, None이면 종료
+# arg는 명령어 뒤에 붙은 문자열 (없으면 '')
+def _cmd_quit(servo, params, arg):
+    return None
 
+def _cmd_reload(servo, params, arg):
+    params = build_params(load_config(force=True))
+    print(f"설정 다시 로드됨: rotation_time={params.rotation_time}초")
+    return params
+
+def _cmd_open(servo, params, arg):
+    print(f"먹이통 열기 (시계방향 {params.rotation_time}초)")
+    _apply_duty(servo, params.cw_duty, params.rotation_time, params.stop_duty)
+    return params
+
+def _cmd_close(servo, params, arg):
+    print(f"먹이통 닫기 (반시계방향 {params.rotation_time}초)")
+    _apply_duty(servo, params.ccw_duty, params.rotation_time, params.stop_duty)
+    return params
+
+def _parse_duration(arg):
+    """cw/ccw 뒤의 회전 시간 파싱 (없으면 1초, 숫자가 아니면 None)
+
+    예외 대신 isdecimal()로 먼저 걸러 float()에서 ValueError가 나지 않게 함
+    (isdigit()은 '²' 같은 float()이 받지 않는 문자도 허용하므로 사용하지 않음)
+    """
+    arg = arg.strip().partition(' ')[0]  # 첫 번째 값만 사용 (뒤의 값은 무시)
+    if not arg:
+        return 1
+    if arg.replace('.', '', 1).isdecimal():
+        return float(arg)
+    print("회전 시간은 0 이상의 숫자로 입력하세요.")
+    return None
+
+def _cmd_cw(servo, params, arg):
+    duration = _parse_duration(arg)
+    if duration is not None:
+        rotate_servo(servo, 'cw', duration, params)
+    return params
+
+def _cmd_ccw(servo, params, arg):
+    duration = _parse_duration(arg)
+    if duration is not None:
+        rotate_servo(servo, 'ccw', duration, params)
+    return params
+
+def _cmd_stop(servo, params, arg):
+    _stop_servo(servo.ChangeDutyCycle, params.stop_duty)
+    print("모터 정지")
+    return params
+
+def _cmd_test(servo, params, arg):
+    rotation_time = params.rotation_time
+    print("전체 동작 테스트 시작...")
+    print("1. 시계방향 3초 회전")
+    rotate_servo(servo, 'cw', 3, params)
+    time.sleep(1)
+
+    print("2. 반시계방향 3초 회전")
+    rotate_servo(servo, 'ccw', 3, params)
+    time.sleep(1)
+
+    print(f"3. 먹이통 열기 ({rotation_time}초)")
+    rotate_servo(servo, 'cw', rotation_time, params)
+    time.sleep(2)
+
+    print(f"4. 먹이통 닫기 ({rotation_time}초)")
+    rotate_servo(servo, 'ccw', rotation_time, params)
+    print("테스트 완료!")
+    return params
+
+def _on_idle(servo):
+    """입력 대기 중 주기 작업: PWM 신호 끄기를 다시 적용해 모터 떨림/드리프트 방지"""
+    servo.ChangeDutyCycle(0)
+
+def _command_lines(servo):
+    """표준 입력에서 명령어를 한 줄씩 반환 (EOF이면 종료)
+
+    input()으로 막혀 있지 않도록 selectors로 입력을 기다리고,
+    IDLE_TICK 동안 입력이 없으면 _on_idle을 실행한다.
+    표준 입력은 os.read로 직접 읽어 버퍼에 남은 줄을 놓치지 않게 함
+    표준 입력이 일반 파일이면(epoll 등록 불가) 기다리지 않고 바로 읽음
+    """
+    fd = sys.stdin.fileno()
+    sel = selectors.DefaultSelector()
+    try:
+        sel.register(fd, selectors.EVENT_READ)
+        pollable = True
+    except PermissionError:
+        pollable = False
+    pending = b''
     try:
         while True:
-            cmd = input("명령 입력> ").strip().lower()
-            parts = cmd.split()
+            # 앞서 print한 출력이 먼저 나가도록 비운 뒤 프롬프트는 직접 write
+            sys.stdout.flush()
+            os.write(1, _PROMPT_BYTES)
+            while b'\n' not in pending:
+                if pollable and not sel.select(timeout=IDLE_TICK):
+                    _on_idle(servo)
+                    continue
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    if pending:
+                        yield pending.decode('utf-8', 'replace')
+                    return
+                pending += chunk
+            line, _, pending = pending.partition(b'\n')
+            yield line.decode('utf-8', 'replace')
+    finally:
+        sel.close()
+
+DISPATCH = {
+    'q': _cmd_quit,
+    'quit': _cmd_quit,
+    'reload': _cmd_reload,
+    'open': _cmd_open,
+    'close': _cmd_close,
+    'cw': _cmd_cw,
+    'ccw': _cmd_ccw,
+    'stop': _cmd_stop,
+    'test': _cmd_test,
+}
+
+def main():
+    """메인 테스트 함수"""
+    params = build_params(load_config())
+    sys.stdout.write(_BANNER_TEMPLATE.format(
+        rotation_time=params.rotation_time,
+        cw_duty=params.cw_duty,
+        ccw_duty=params.ccw_duty
+    ))
+    sys.stdout.flush()
 
-            if not parts:
+    servo = setup_gpio()
+
+    try:
+        for line in _command_lines(servo):
+            # 탭도 공백으로 바꿔 partition(' ')이 split()처럼 나누도록 함
+            cmd = line.strip().lower().replace('\t', ' ')
+            if not cmd:
                 continue
 
-            command = parts[0]
+            command, _, arg = cmd.partition(' ')
+            handler = DISPATCH.get(command)
+            if handler is None:
+                print("올바른 명령어를 입력하세요.")
+                continue
 
-            if command == 'quit' or command == 'q':
+            params = handler(servo, params, arg)
+            if params is None:
                 break
-            elif command == 'reload':
-                config = load_config()
-                rotation_time = config.get('rotation_time', DEFAULT_ROTATION_TIME)
-                print(f"설정 다시 로드됨: rotation_time={rotation_time}초")
-            elif command == 'open':
-                print(f"먹이통 열기 (시계방향 {rotation_time}초)")
-                rotate_servo(servo, 'cw', rotation_time, config)
-            elif command == 'close':
-                print(f"먹이통 닫기 (반시계방향 {rotation_time}초)")
-                rotate_servo(servo, 'ccw', rotation_time, config)
-            elif command == 'cw':
-                duration = float(parts[1]) if len(parts) > 1 else 1
-                rotate_servo(servo, 'cw', duration, config)
-            elif command == 'ccw':
-                duration = float(parts[1]) if len(parts) > 1 else 1
-                rotate_servo(servo, 'ccw', duration, config)
-            elif command == 'stop':
-                servo.ChangeDutyCycle(stop_duty)
-                time.sleep(0.1)
-                servo.ChangeDutyCycle(0)
-                print("모터 정지")
-            elif command == 'test':
-                print("전체 동작 테스트 시작...")
-                print("1. 시계방향 3초 회전")
-                rotate_servo(servo, 'cw', 3, config)
-                time.sleep(1)
-
-                print("2. 반시계방향 3초 회전")
-                rotate_servo(servo, 'ccw', 3, config)
-                time.sleep(1)
-
-                print(f"3. 먹이통 열기 ({rotation_time}초)")
-                rotate_servo(servo, 'cw', rotation_time, config)
-                time.sleep(2)
-
-                print(f"4. 먹이통 닫기 ({rotation_time}초)")
-                rotate_servo(servo, 'ccw', rotation_time, config)
-                print("테스트 완료!")
-            else:
-                print("올바른 명령어를 입력하세요.")
 
     except KeyboardInterrupt:
         print("\n프로그램 종료...")
-    finally:
-        servo.ChangeDutyCycle(0)
-        servo.stop()
-        GPIO.cleanup()
-        print("GPIO 정리 완료")
 
 if __name__ == "__main__":
     main()